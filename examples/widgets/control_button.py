@@ -4,6 +4,12 @@ from math import floor
 from trame_client.widgets.html import Span
 from trame_vuetify.widgets.vuetify3 import VBtn, VIcon, VTooltip
 
+_TOOLTIP_KWARGS = {
+    "activator": "parent",
+    "transition": "slide-x-transition",
+    "location": "right",
+}
+
 
 class ControlButton(VBtn):
     def __init__(
@@ -31,9 +37,5 @@ class ControlButton(VBtn):
 
         with self:
             VIcon(icon, size=icon_size)
-            with VTooltip(
-                activator="parent",
-                transition="slide-x-transition",
-                location="right",
-            ):
+            with VTooltip(**_TOOLTIP_KWARGS):
                 Span(f"{name}")
@@ -40,6 +40,10 @@ class VRPresetSelect(VSelect):
                 Span("{{item.title}}", classes="pl-2")
 
     def _populate_presets(self):
+        # Preset icons are read and encoded from disk, only do it once per server
+        if StateId.vr_presets in self.state:
+            return
+
         presets = [
             {"title": name, "props": {"data": data}}
             for name, data in get_volume_rendering_presets_icon_url(
@@ -48,7 +52,7 @@ class VRPresetSelect(VSelect):
             )
         ]
 
-        self.state.setdefault(StateId.vr_presets, presets)
+        self.state[StateId.vr_presets] = presets
 
     @property
     def _volume_rendering(self):
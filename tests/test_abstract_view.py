@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 import vtk
 from slicer import (
     vtkMRMLCameraDisplayableManager,
@@ -51,3 +53,25 @@ def test_displayable_group_can_be_initialized_by_factories(a_slicer_app):
     displayable_manager_group = vtkMRMLDisplayableManagerGroup()
     displayable_manager_group.Initialize(factory, renderer)
     assert displayable_manager_group.GetDisplayableManagerCount() == 2
+
+
+def test_abstract_view_defers_scheduled_render_until_displayed():
+    view = AbstractView()
+    strategy = MagicMock()
+    view.set_scheduled_render(strategy)
+
+    view.set_displayed(False)
+    view.schedule_render()
+    strategy.schedule_render.assert_not_called()
+
+    view.set_displayed(True)
+    strategy.schedule_render.assert_called_once()
+
+
+def test_abstract_view_renders_explicitly_when_not_displayed():
+    view = AbstractView()
+    view._render_interactor = MagicMock()
+
+    view.set_displayed(False)
+    view.render()
+    view._render_interactor.assert_called_once()
@@ -161,3 +161,35 @@ def test_dispatcher_can_unobserve_unbound_observers():
 
     sphere.SetRadius(42.0)
     mock.assert_not_called()
+
+
+def test_dispatcher_unobserving_one_bound_observer_keeps_other_instances():
+    inst = AClass()
+    other_inst = AClass()
+
+    sphere = vtkSphereSource()
+    dispatcher = VtkEventDispatcher()
+    dispatcher.attach_vtk_observer(sphere, "ModifiedEvent")
+    dispatcher.add_dispatch_observer(inst.method)
+    dispatcher.add_dispatch_observer(other_inst.method)
+    dispatcher.remove_dispatch_observer(inst.method)
+
+    sphere.SetRadius(42.0)
+    inst.mock.assert_not_called()
+    other_inst.mock.assert_called_once()
+
+
+def test_dispatcher_can_detach_from_all_vtk_objects():
+    inst = AClass()
+
+    spheres = [vtkSphereSource() for _ in range(2)]
+    dispatcher = VtkEventDispatcher()
+    for s in spheres:
+        dispatcher.attach_vtk_observer(s, "ModifiedEvent")
+
+    dispatcher.add_dispatch_observer(inst.method)
+    dispatcher.detach_all_vtk_observers()
+
+    for s in spheres:
+        s.SetRadius(42.0)
+    inst.mock.assert_not_called()
@@ -132,6 +132,19 @@ def test_an_io_manager_can_load_segmentations_in_stl_format(
     assert segmentation.GetNumberOfSegments() == 1
 
 
+def test_an_io_manager_loads_segmentations_with_upper_case_model_extensions(
+    an_io_manager,
+    a_segmentation_stl_file_path,
+    tmpdir,
+):
+    upper_case_path = Path(tmpdir) / "segmentation.STL"
+    upper_case_path.write_bytes(a_segmentation_stl_file_path.read_bytes())
+
+    segmentation_node = an_io_manager.load_segmentation(upper_case_path.as_posix())
+    assert isinstance(segmentation_node, vtkMRMLSegmentationNode)
+    assert segmentation_node.GetSegmentation().GetNumberOfSegments() == 1
+
+
 def test_an_io_manager_can_write_models(an_io_manager, a_model_node, tmpdir):
     out_path = Path(tmpdir, "out.obj")
     an_io_manager.write_model(a_model_node, out_path)
@@ -89,7 +89,7 @@ def test_changing_layout_triggers_view_creation(
     a_mock_view_manager,
     a_sagittal_view,
 ):
-    a_mock_view_manager.is_view_created.return_value = False
+    a_mock_view_manager.get_created_view_ids.return_value = set()
 
     sagittal_layout = Layout(
         LayoutDirection.Horizontal,
@@ -166,6 +166,47 @@ def test_current_layout_is_stored_in_scene(
     )
 
 
+def test_overwriting_current_layout_updates_layout_stored_in_scene(
+    a_layout_manager,
+    a_slicer_scene,
+    a_sagittal_layout,
+    a_coronal_layout,
+):
+    a_layout_manager.register_layout("L1", a_sagittal_layout)
+    a_layout_manager.set_layout("L1")
+    a_layout_manager.register_layout("L1", a_coronal_layout)
+
+    node = a_slicer_scene.GetNodesByClass("vtkMRMLScriptedModuleNode").GetItemAsObject(
+        0
+    )
+    assert pretty_xml(node.GetParameter("layout_description")) == pretty_xml(
+        vue_layout_to_slicer(a_coronal_layout)
+    )
+
+
+def test_editing_registered_layout_updates_layout_stored_in_scene(
+    a_layout_manager,
+    a_slicer_scene,
+    a_sagittal_layout,
+    a_coronal_layout,
+    a_coronal_view,
+):
+    a_layout_manager.register_layout("L1", a_sagittal_layout)
+    a_layout_manager.register_layout("L2", a_coronal_layout)
+    a_layout_manager.set_layout("L1")
+
+    a_sagittal_layout.items.append(a_coronal_view)
+    a_layout_manager.set_layout("L2")
+    a_layout_manager.set_layout("L1")
+
+    node = a_slicer_scene.GetNodesByClass("vtkMRMLScriptedModuleNode").GetItemAsObject(
+        0
+    )
+    assert pretty_xml(node.GetParameter("layout_description")) == pretty_xml(
+        vue_layout_to_slicer(a_sagittal_layout)
+    )
+
+
 def test_layout_can_be_restored_from_scene(
     a_layout_manager,
     a_slicer_scene,
@@ -174,6 +215,8 @@ def test_layout_can_be_restored_from_scene(
     a_sagittal_layout,
     a_sagittal_view,
 ):
+    a_mock_view_manager.get_created_view_ids.return_value = set()
+
     node = a_slicer_scene.AddNewNodeByClass("vtkMRMLScriptedModuleNode")
     node.SetParameter("layout_id", "L1")
     node.SetParameter(
@@ -185,6 +228,42 @@ def test_layout_can_be_restored_from_scene(
     assert a_layout_manager.has_layout("L1")
     assert a_layout_manager.get_layout("L1") == a_sagittal_layout
     a_mock_ui.clear.assert_called_once()
-    a_mock_view_manager.is_view_created.assert_called_once_with(
-        a_sagittal_view.singleton_tag
+    a_mock_view_manager.get_created_view_ids.assert_called_once_with()
+    a_mock_view_manager.create_view.assert_called_once_with(a_sagittal_view)
+
+
+def test_layout_manager_only_hides_views_of_its_previous_layout(
+    a_layout_manager,
+    a_mock_view_manager,
+    a_sagittal_layout,
+    a_sagittal_view,
+    a_coronal_view,
+):
+    sagittal_view, coronal_view, other_view = (
+        mock.MagicMock(),
+        mock.MagicMock(),
+        mock.MagicMock(),
     )
+    views = {
+        a_sagittal_view.singleton_tag: sagittal_view,
+        a_coronal_view.singleton_tag: coronal_view,
+    }
+    a_mock_view_manager.get_view.side_effect = views.get
+    a_mock_view_manager.get_views.return_value = [
+        sagittal_view,
+        coronal_view,
+        other_view,
+    ]
+
+    a_layout_manager.register_layout("L1", a_sagittal_layout)
+    a_layout_manager.register_layout(
+        "L2", Layout(LayoutDirection.Vertical, [a_coronal_view])
+    )
+    a_layout_manager.set_layout("L1")
+    sagittal_view.set_displayed.assert_called_once_with(True)
+    coronal_view.set_displayed.assert_not_called()
+
+    a_layout_manager.set_layout("L2")
+    sagittal_view.set_displayed.assert_called_with(False)
+    coronal_view.set_displayed.assert_called_once_with(True)
+    other_view.set_displayed.assert_not_called()
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from trame_slicer.views import AsyncIORendering
+
+
+@pytest.fixture
+def a_mock_view():
+    return MagicMock()
+
+
+@pytest.fixture
+def an_async_rendering(a_mock_view):
+    rendering = AsyncIORendering(schedule_render_fps=100.0)
+    rendering.set_abstract_view(a_mock_view)
+    return rendering
+
+
+@pytest.mark.asyncio
+async def test_async_rendering_coalesces_multiple_schedule_calls(
+    an_async_rendering,
+    a_mock_view,
+):
+    for _ in range(10):
+        an_async_rendering.schedule_render()
+
+    await asyncio.sleep(0.05)
+    a_mock_view.render.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_rendering_does_not_render_if_view_rendered_in_between(
+    an_async_rendering,
+    a_mock_view,
+):
+    an_async_rendering.schedule_render()
+    an_async_rendering.did_render()
+
+    await asyncio.sleep(0.05)
+    a_mock_view.render.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_rendering_can_schedule_after_render(
+    an_async_rendering,
+    a_mock_view,
+):
+    an_async_rendering.schedule_render()
+    await asyncio.sleep(0.05)
+    an_async_rendering.schedule_render()
+    await asyncio.sleep(0.05)
+    assert a_mock_view.render.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_rendering_waits_for_next_frame_deadline_after_render(
+    a_mock_view,
+):
+    rendering = AsyncIORendering(schedule_render_fps=10.0)
+    rendering.set_abstract_view(a_mock_view)
+    a_mock_view.render.side_effect = rendering.did_render
+
+    rendering.schedule_render()
+    await asyncio.sleep(0.02)
+    assert a_mock_view.render.call_count == 1
+
+    rendering.schedule_render()
+    await asyncio.sleep(0.02)
+    assert a_mock_view.render.call_count == 1
+
+    await asyncio.sleep(0.15)
+    assert a_mock_view.render.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_rendering_shutdown_cancels_pending_render(
+    an_async_rendering,
+    a_mock_view,
+):
+    an_async_rendering.schedule_render()
+    an_async_rendering.shutdown()
+
+    await asyncio.sleep(0.05)
+    a_mock_view.render.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_rendering_renders_again_if_scheduled_while_rendering(
+    an_async_rendering,
+    a_mock_view,
+):
+    def render_and_request_new_render():
+        if a_mock_view.render.call_count == 1:
+            an_async_rendering.schedule_render()
+        an_async_rendering.did_render()
+
+    a_mock_view.render.side_effect = render_and_request_new_render
+
+    an_async_rendering.schedule_render()
+    await asyncio.sleep(0.05)
+    assert a_mock_view.render.call_count == 2
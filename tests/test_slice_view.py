@@ -20,6 +20,9 @@ def test_slice_view_can_display_volume(
     )
     assert a_slice_view.get_slice_step() == 1
     assert a_slice_view.get_slice_value() == pytest.approx(6.9, 0.1)
+    np.testing.assert_array_almost_equal(
+        a_slice_view.get_slice_range_and_step(), [-121.1, 133.9, 1], decimal=1
+    )
 
     a_slice_view.render()
     if render_interactive:
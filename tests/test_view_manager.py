@@ -92,6 +92,34 @@ def test_view_manager_returns_existing_view_if_created(a_view_manager, a_2d_view
     assert v1 == v2
 
 
+def test_view_manager_returns_created_view_ids(a_view_manager, a_2d_view, a_3d_view):
+    a_view_manager.register_factory(FakeFactory(can_create=True))
+    assert a_view_manager.get_created_view_ids() == set()
+
+    a_view_manager.create_view(a_2d_view)
+    a_view_manager.create_view(a_3d_view)
+    assert a_view_manager.get_created_view_ids() == {"2d_view", "3d_view"}
+
+
+def test_view_factory_get_views_follows_view_creation_and_removal(
+    a_slicer_app, a_2d_view, a_3d_view
+):
+    factory = FakeFactory(can_create=True)
+    assert factory.get_views() == []
+
+    v1 = factory.create_view(a_2d_view, a_slicer_app.scene, a_slicer_app.app_logic)
+    assert factory.get_views() == [v1]
+
+    v2 = factory.create_view(a_3d_view, a_slicer_app.scene, a_slicer_app.app_logic)
+    assert factory.get_views() == [v1, v2]
+
+    factory.get_views().clear()
+    assert factory.get_views() == [v1, v2]
+
+    assert factory.remove_view(a_2d_view.singleton_tag)
+    assert factory.get_views() == [v2]
+
+
 def test_view_manager_with_default_factories_created_nodes_are_added_to_slicer_scene(
     a_view_manager,
     a_slicer_app,
@@ -17,6 +17,8 @@ from slicer import (
 from .segmentation_editor import SegmentationEditor
 from .volumes_reader import VolumesReader
 
+_MODEL_FILE_EXTENSIONS = frozenset((".obj", ".stl", ".ply"))
+
 
 class IOManager:
     """
@@ -104,7 +106,7 @@ class IOManager:
     def load_segmentation(
         self, segmentation_file: str | Path, do_convert_to_slicer_coord=True
     ) -> vtkMRMLSegmentationNode | None:
-        if Path(segmentation_file).suffix in [".obj", ".stl", ".ply"]:
+        if Path(segmentation_file).suffix.lower() in _MODEL_FILE_EXTENSIONS:
             model = self.load_model(segmentation_file, do_convert_to_slicer_coord)
             try:
                 return (
@@ -155,8 +157,7 @@ class IOManager:
         return self._load_mrml_scene(scene_path)
 
     def save_scene(self, scene_path: str | Path) -> bool:
-        scene_path = Path(scene_path)
-        scene_path = scene_path.resolve()
+        scene_path = Path(scene_path).resolve()
         base_dir = scene_path.parent
         base_dir.mkdir(parents=True, exist_ok=True)
         self.scene.SetURL(scene_path.as_posix())
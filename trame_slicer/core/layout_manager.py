@@ -2,6 +2,7 @@ from slicer import vtkMRMLScene, vtkMRMLScriptedModuleNode
 from trame_client.widgets.core import VirtualNode
 
 from trame_slicer.views import (
+    AbstractView,
     Layout,
     LayoutDirection,
     LayoutGrid,
@@ -30,9 +31,11 @@ class LayoutManager:
         layout_ui_node: VirtualNode,
     ):
         self._layouts: dict[str, Layout] = {}
+        self._layout_descriptions: dict[str, tuple[str, str]] = {}
         self._view_manager = view_manager
         self._ui = layout_ui_node
         self._current_layout: str | None = None
+        self._displayed_views: list[AbstractView] = []
         self._scene_node = scene.AddNewNodeByClass(
             "vtkMRMLScriptedModuleNode", "layout_node"
         )
@@ -54,23 +57,51 @@ class LayoutManager:
 
     def _refresh_layout(self):
         layout = self._layouts.get(self._current_layout, Layout.empty_layout())
-        self._create_views_if_needed(layout)
+        layout_views = layout.get_views(is_recursive=True)
+        self._create_views_if_needed(layout_views)
+        self._update_displayed_views(layout_views)
         with self._ui.clear():
             LayoutGrid.create_root_grid_ui(layout)
         self._save_layout_to_scene(self._current_layout, layout)
 
-    def _create_views_if_needed(self, layout: Layout) -> None:
-        views = layout.get_views(is_recursive=True)
-        for view in views:
-            if not self._view_manager.is_view_created(view.singleton_tag):
+    def _create_views_if_needed(self, layout_views: list[ViewLayoutDefinition]) -> None:
+        created_view_ids = self._view_manager.get_created_view_ids()
+        for view in layout_views:
+            if view.singleton_tag not in created_view_ids:
                 self._view_manager.create_view(view)
 
+    def _update_displayed_views(self, layout_views: list[ViewLayoutDefinition]) -> None:
+        displayed_views = []
+        for layout_view in layout_views:
+            view = self._view_manager.get_view(layout_view.singleton_tag)
+            if view is not None:
+                displayed_views.append(view)
+
+        displayed_view_ids = {id(view) for view in displayed_views}
+        # Only hide the views placed by the previous layout, other views may be displayed outside of this manager.
+        for view in self._displayed_views:
+            if id(view) not in displayed_view_ids:
+                view.set_displayed(False)
+
+        for view in displayed_views:
+            view.set_displayed(True)
+        self._displayed_views = displayed_views
+
     def _save_layout_to_scene(self, layout_id: str, layout: Layout) -> None:
         self._scene_node.SetParameter("layout_id", layout_id)
         self._scene_node.SetParameter(
-            "layout_description", pretty_xml(vue_layout_to_slicer(layout))
+            "layout_description", self._get_layout_description(layout_id, layout)
         )
 
+    def _get_layout_description(self, layout_id: str, layout: Layout) -> str:
+        # Layouts are mutable, only reuse the pretty printed description if the layout content is unchanged.
+        layout_xml = vue_layout_to_slicer(layout)
+        cached_xml, description = self._layout_descriptions.get(layout_id, ("", ""))
+        if cached_xml != layout_xml:
+            description = pretty_xml(layout_xml)
+            self._layout_descriptions[layout_id] = (layout_xml, description)
+        return description
+
     def set_layout_from_node(self, node: vtkMRMLScriptedModuleNode) -> None:
         if not node:
             _error_msg = "Cannot set layout from None scene node."
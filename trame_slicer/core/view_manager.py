@@ -69,6 +69,12 @@ class ViewManager:
         """
         return any(factory.has_view(view_id) for factory in self._factories)
 
+    def get_created_view_ids(self) -> set[str]:
+        """
+        Returns the ids of every view created by the registered factories.
+        """
+        return set().union(*(factory.get_view_ids() for factory in self._factories))
+
     def get_views(self, view_group: int | None = None) -> list[AbstractView]:
         views = list(chain(*[factory.get_views() for factory in self._factories]))
         return [
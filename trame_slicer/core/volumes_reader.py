@@ -80,8 +80,11 @@ class VolumesReader:
         if cls.contains_dcm_volume(volume_files):
             volume_nodes = cls.load_dcm_volumes(scene, volume_files)
         else:
+            volumes_logic = cls._create_volumes_logic(scene, app_logic)
             volume_nodes = [
-                cls.load_single_file_volume(scene, app_logic, volume_file)
+                cls.load_single_file_volume(
+                    scene, app_logic, volume_file, volumes_logic
+                )
                 for volume_file in volume_files
             ]
 
@@ -93,14 +96,32 @@ class VolumesReader:
         scene: vtkMRMLScene,
         app_logic: vtkMRMLApplicationLogic,
         volume_file: str,
+        volumes_logic: vtkSlicerVolumesLogic | None = None,
     ) -> vtkMRMLVolumeNode | None:
+        """
+        Loads a single file volume in the scene.
+        :param volumes_logic: Optional logic to reuse when loading multiple files. Created if not provided.
+        """
         file_name, name = cls._file_name_from_volume_path(volume_file)
         file_list = vtkStringArray()
+        logic = (
+            volumes_logic
+            if volumes_logic is not None
+            else cls._create_volumes_logic(scene, app_logic)
+        )
+        options = 0
+        return logic.AddArchetypeVolume(file_name, name, options, file_list)
+
+    @classmethod
+    def _create_volumes_logic(
+        cls,
+        scene: vtkMRMLScene,
+        app_logic: vtkMRMLApplicationLogic,
+    ) -> vtkSlicerVolumesLogic:
         logic = vtkSlicerVolumesLogic()
         logic.SetMRMLApplicationLogic(app_logic)
         logic.SetMRMLScene(scene)
-        options = 0
-        return logic.AddArchetypeVolume(file_name, name, options, file_list)
+        return logic
 
     @classmethod
     def contains_dcm_volume(cls, volume_files: list[str]) -> bool:
@@ -110,8 +131,9 @@ class VolumesReader:
 
     @classmethod
     def is_dcm_file(cls, file_name: str) -> bool:
+        # Use the cached header read to avoid parsing the file again when reading its tags
         try:
-            dcmread(file_name, stop_before_pixels=True)
+            cls._dcm_read_file(file_name)
             return True
         except InvalidDicomError:
             return False
@@ -23,6 +23,11 @@ from trame_slicer.views import (
     create_vertical_view_gutter_ui,
 )
 
+_VIEW_CONTAINER_STYLE = (
+    "position: relative; width: 100%; height: 100%; overflow: hidden;"
+)
+_RCA_AREA_STYLE = "position: relative; width: 100%; height: 100%;"
+
 
 @dataclass
 class RcaView:
@@ -62,6 +67,8 @@ def register_rca_factories(
 
 
 class RcaRenderStrategy(ScheduledRenderStrategy):
+    __slots__ = ("_scheduler",)
+
     def __init__(self, rca_scheduler: RcaRenderScheduler):
         super().__init__()
         self._scheduler = rca_scheduler
@@ -143,13 +150,11 @@ class RemoteViewFactory(IViewFactory):
         return RcaView(vuetify_view, slicer_view, rca_view_adapter)
 
     def _create_vuetify_ui(self, view_id: str, slicer_view: AbstractView):
-        with Div(
-            style=("position: relative;width: 100%;height: 100%;overflow: hidden;")
-        ):
+        with Div(style=_VIEW_CONTAINER_STYLE):
             RemoteControlledArea(
                 name=view_id,
                 display="image",
-                style="position: relative; width: 100%; height: 100%;",
+                style=_RCA_AREA_STYLE,
                 send_mouse_move=True,
             )
 
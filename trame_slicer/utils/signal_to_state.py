@@ -1,5 +1,5 @@
 from trame_server.state import State
-from trame_server.utils.asynchronous import create_task
+from trame_server.utils.asynchronous import get_event_loop
 from undo_stack import Signal, SignalContainer
 
 
@@ -12,11 +12,11 @@ def connect_signal_emit_values_to_state(
         if len(args) == 1:
             args = args[0]
 
-        async def set_state():
+        def set_state():
             state[name] = args
             state.flush()
 
-        create_task(set_state())
+        get_event_loop().call_soon(set_state)
 
     signal.connect(inner)
     if default:
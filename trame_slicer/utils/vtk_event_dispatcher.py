@@ -12,8 +12,19 @@ class VtkEventDispatcher:
     Information forwarded through this output is defined by the user.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_inst_obs",
+        "_is_blocked",
+        "_obs_id",
+        "_trigger_args",
+        "_trigger_kwargs",
+        "_vtk_obj",
+        "_weak_obs",
+    )
+
     def __init__(self):
-        self._weak_obs: list[WeakMethod] = []
+        self._weak_obs: dict[tuple[int, Callable], WeakMethod] = {}
         self._inst_obs: set[Callable] = set()
         self._vtk_obj: dict[int, tuple[ref, int]] = {}
         self._obs_id = count()
@@ -41,23 +52,31 @@ class VtkEventDispatcher:
         if obs_id not in self._vtk_obj:
             return
 
-        obj, obs_id = self._vtk_obj[obs_id]
+        obj, obs_id = self._vtk_obj.pop(obs_id)
         obj = obj()
         if obj is None:
             return
 
         obj.RemoveObserver(obs_id)
 
+    def detach_all_vtk_observers(self) -> None:
+        for obs_id in list(self._vtk_obj):
+            self.detach_vtk_observer(obs_id)
+
+    @staticmethod
+    def _weak_obs_key(obs: Callable) -> tuple[int, Callable]:
+        return id(obs.__self__), obs.__func__
+
     def add_dispatch_observer(self, obs: Callable) -> None:
         try:
-            self._weak_obs.append(WeakMethod(obs))
+            self._weak_obs[self._weak_obs_key(obs)] = WeakMethod(obs)
         except TypeError:
             self._inst_obs.add(obs)
 
     def remove_dispatch_observer(self, obs: Callable) -> None:
-        self._weak_obs = [_obs for _obs in self._weak_obs if _obs() != obs]
-        if obs in self._inst_obs:
-            self._inst_obs.remove(obs)
+        if hasattr(obs, "__self__") and hasattr(obs, "__func__"):
+            self._weak_obs.pop(self._weak_obs_key(obs), None)
+        self._inst_obs.discard(obs)
 
     def set_dispatch_information(self, *args, **kwargs) -> None:
         self._trigger_args = args
@@ -67,8 +86,20 @@ class VtkEventDispatcher:
         if self._is_blocked:
             return
 
-        observers = [obs() for obs in self._weak_obs if obs() is not None] + list(
-            self._inst_obs
-        )
+        # Resolve each weak observer once and forget the ones whose instance was deleted.
+        observers = []
+        dead_keys = []
+        for key, weak_obs in self._weak_obs.items():
+            obs = weak_obs()
+            if obs is None:
+                dead_keys.append(key)
+            else:
+                observers.append(obs)
+
+        for key in dead_keys:
+            del self._weak_obs[key]
+
+        observers.extend(self._inst_obs)
+        args, kwargs = self._trigger_args, self._trigger_kwargs
         for obs in observers:
-            obs(*self._trigger_args, **self._trigger_kwargs)
+            obs(*args, **kwargs)
@@ -1,6 +1,7 @@
 from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Literal, TypeVar
 
 from slicer import (
@@ -28,6 +29,17 @@ from .view_interaction_dispatch import (
 
 ViewOrientation = Literal["Axial", "Coronal", "Sagittal"]
 
+_VIEW_PROPS_XML_NAME_MAP = MappingProxyType(
+    {
+        "orientation": "orientation",
+        "viewlabel": "label",
+        "viewcolor": "color",
+        "viewgroup": "group",
+        "background_color": "background_color",
+        "box_visible": "box_visible",
+    }
+)
+
 
 @dataclass
 class ViewProps:
@@ -43,26 +55,18 @@ class ViewProps:
             self.group = int(self.group)
 
     def to_xml(self) -> str:
-        property_map = {
-            key: getattr(self, value) for key, value in self.xml_name_map().items()
-        }
-
-        return "".join(
-            f'<property name="{name}" action="default">{value}</property>'
-            for name, value in property_map.items()
-            if value is not None
-        )
+        xml_parts = []
+        for xml_name, attr_name in self.xml_name_map().items():
+            value = getattr(self, attr_name)
+            if value is not None:
+                xml_parts.append(
+                    f'<property name="{xml_name}" action="default">{value}</property>'
+                )
+        return "".join(xml_parts)
 
     @classmethod
-    def xml_name_map(cls):
-        return {
-            "orientation": "orientation",
-            "viewlabel": "label",
-            "viewcolor": "color",
-            "viewgroup": "group",
-            "background_color": "background_color",
-            "box_visible": "box_visible",
-        }
+    def xml_name_map(cls) -> MappingProxyType[str, str]:
+        return _VIEW_PROPS_XML_NAME_MAP
 
     @classmethod
     def from_xml_dict(cls, xml_prop_dict: dict):
@@ -82,24 +86,29 @@ class AbstractView:
     def __init__(
         self,
         scheduled_render_strategy: ScheduledRenderStrategy | None = None,
-        *args,
-        **kwargs,
     ):
-        super().__init__(*args, *kwargs)
         self._renderer = vtkRenderer()
         self._render_window = vtkRenderWindow()
         self._render_window.ShowWindowOff()
         self._render_window.SetMultiSamples(0)
         self._render_window.AddRenderer(self._renderer)
 
+        # Render requests are coalesced until the next render of the window, whichever strategy triggers it.
+        self._is_render_scheduled = False
+        self._is_displayed = True
+        self._start_render_obs_id = self._render_window.AddObserver(
+            vtkCommand.StartEvent, self._on_render_window_start_render
+        )
+
         self._render_window_interactor = vtkRenderWindowInteractor()
         self._render_window_interactor.SetRenderWindow(self._render_window)
         self._render_window_interactor.Initialize()
+        self._render_interactor = self._render_window_interactor.Render
 
         self.displayable_manager_group = vtkMRMLDisplayableManagerGroup()
         self.displayable_manager_group.SetRenderer(self._renderer)
-        self.displayable_manager_group.AddObserver(
-            vtkCommand.UpdateEvent, self.schedule_render
+        self._update_obs_id = self.displayable_manager_group.AddObserver(
+            vtkCommand.UpdateEvent, self._on_update_event
         )
         self.mrml_scene: vtkMRMLScene | None = None
         self.mrml_view_node: vtkMRMLAbstractViewNode | None = None
@@ -127,8 +136,15 @@ class AbstractView:
     ) -> None:
         self._scheduled_render = scheduled_render_strategy or DirectRendering()
         self._scheduled_render.set_abstract_view(self)
+        self._is_render_scheduled = False
 
     def finalize(self):
+        self.displayable_manager_group.RemoveObserver(self._update_obs_id)
+        self._render_window.RemoveObserver(self._start_render_obs_id)
+        self._modified_dispatcher.detach_all_vtk_observers()
+        if self._scheduled_render:
+            self._scheduled_render.shutdown()
+
         self.render_window().ShowWindowOff()
         self.render_window().Finalize()
 
@@ -136,7 +152,10 @@ class AbstractView:
         self._render_window.AddRenderer(renderer)
 
     def renderers(self) -> list[vtkRenderer]:
-        return list(self._render_window.GetRenderers())
+        renderers = self._render_window.GetRenderers()
+        return [
+            renderers.GetItemAsObject(i) for i in range(renderers.GetNumberOfItems())
+        ]
 
     def first_renderer(self) -> vtkRenderer:
         return self._renderer
@@ -144,28 +163,63 @@ class AbstractView:
     def renderer(self) -> vtkRenderer:
         return self.first_renderer()
 
-    def schedule_render(self, *_) -> None:
-        if not self._scheduled_render:
+    def _on_update_event(self, _caller, _event) -> None:
+        if not self._is_render_scheduled:
+            self.schedule_render()
+
+    def schedule_render(self) -> None:
+        if not self._scheduled_render or self._is_render_scheduled:
+            return
+
+        # Views which are not displayed keep the request pending and only render once displayed again
+        self._is_render_scheduled = True
+        if not self._is_displayed:
             return
         self._scheduled_render.schedule_render()
 
-    def render(self) -> None:
-        self._render_window_interactor.Render()
-        if not self._scheduled_render:
+    def set_displayed(self, is_displayed: bool) -> None:
+        """
+        Sets if the view is currently displayed in the UI.
+        Scheduled renders of views which are not displayed are deferred until they are displayed again.
+        """
+        if self._is_displayed == is_displayed:
             return
-        self._scheduled_render.did_render()
+
+        self._is_displayed = is_displayed
+        if is_displayed and self._is_render_scheduled:
+            self._is_render_scheduled = False
+            self.schedule_render()
+
+    def is_displayed(self) -> bool:
+        return self._is_displayed
+
+    def _on_render_window_start_render(self, _caller, _event) -> None:
+        self._is_render_scheduled = False
+
+    def render(self) -> None:
+        """
+        Renders the view.
+        Explicit renders are done even if the view is not displayed (see set_displayed), for instance for screenshots.
+        """
+        self._render_interactor()
+        scheduled_render = self._scheduled_render
+        if scheduled_render:
+            scheduled_render.did_render()
+
+        # Pending strategy requests are cleared by did_render, make sure the next request is forwarded
+        self._is_render_scheduled = False
 
     def render_window(self) -> vtkRenderWindow:
         return self._render_window
 
     def interactor(self) -> vtkRenderWindowInteractor:
-        return self.render_window().GetInteractor()
+        return self._render_window_interactor
 
     def interactor_style(self) -> vtkInteractorStyle | None:
-        return self.interactor().GetInteractorStyle()
+        return self._render_window_interactor.GetInteractorStyle()
 
     def set_mrml_view_node(self, node: vtkMRMLViewNode) -> None:
-        if self.mrml_view_node == node:
+        if self.mrml_view_node is node:
             return
 
         with self.trigger_modified_once():
@@ -205,15 +259,15 @@ class AbstractView:
             setter(value)
 
     def set_mrml_scene(self, scene: vtkMRMLScene) -> None:
-        if self.mrml_scene == scene:
+        if self.mrml_scene is scene:
             return
 
         self.mrml_scene = scene
-        if self.mrml_view_node and self.mrml_view_node.GetScene() != scene:
+        if self.mrml_view_node and self.mrml_view_node.GetScene() is not scene:
             self.mrml_view_node = None
 
     def reset_camera(self):
-        for renderer in self._render_window.GetRenderers():
+        for renderer in self.renderers():
             renderer.ResetCamera()
 
     def add_modified_observer(self, observer: Callable) -> None:
@@ -1,12 +1,20 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from itertools import chain
 from typing import Protocol, Union, runtime_checkable
 
+from lxml import etree
 from trame.widgets import client, html
 
 from .view_layout_definition import ViewLayoutDefinition
 
+_GRID_ROW_CLASSES = "layout-grid-container d-flex flex-row"
+_GRID_COLUMN_CLASSES = "layout-grid-container d-flex flex-column"
+_GRID_STYLE = "flex: 1;"
+_GRID_CELL_DEFAULT_STYLE = "flex: 1;"
+_GRID_ITEM_STYLE = "display: flex; flex: 1; border: 1px solid #222;"
+_ROOT_GRID_CLASSES = "d-flex flex-column flex-grow-1 fill-height"
+_ROOT_GRID_STYLE = "background-color:black;"
+
 
 class LayoutDirection(Enum):
     Vertical = auto()
@@ -18,7 +26,7 @@ class View(Protocol):
     singleton_tag: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Layout:
     direction: LayoutDirection
     items: list[Union["Layout", View]]
@@ -29,20 +37,15 @@ class Layout:
         Returns every views contained in Layout as a flat list.
         :param is_recursive: If true, returns sub layout views as well. Otherwise, returns only direct views.
         """
-        views = [item for item in self.items if isinstance(item, View)]
+        # Items are either sub layouts or views, avoid the slower runtime Protocol check for views.
+        views = [item for item in self.items if not isinstance(item, Layout)]
         if not is_recursive:
             return views
 
-        sub_views = list(
-            chain(
-                *[
-                    item.get_views(is_recursive)
-                    for item in self.items
-                    if isinstance(item, Layout)
-                ]
-            )
-        )
-        return views + sub_views
+        for item in self.items:
+            if isinstance(item, Layout):
+                views.extend(item.get_views(is_recursive))
+        return views
 
     @classmethod
     def empty_layout(cls):
@@ -60,83 +63,84 @@ class LayoutGrid:
         layout_direction: LayoutDirection,
         layout_flex_sizes: list[str] | None = None,
     ):
-        layout_class = (
-            "flex-row"
+        grid_classes = (
+            _GRID_ROW_CLASSES
             if layout_direction == LayoutDirection.Horizontal
-            else "flex-column"
+            else _GRID_COLUMN_CLASSES
         )
+        n_flex_sizes = len(layout_flex_sizes) if layout_flex_sizes else 0
 
-        with html.Div(
-            classes=f"layout-grid-container d-flex {layout_class}",
-            style="flex: 1;",
-        ):
+        with html.Div(classes=grid_classes, style=_GRID_STYLE):
             for i_item, item in enumerate(layout_items):
-                flex_size = (
-                    f"{layout_flex_sizes[i_item]}"
-                    if layout_flex_sizes and len(layout_flex_sizes) > i_item
-                    else "1"
+                cell_style = (
+                    f"flex: {layout_flex_sizes[i_item]};"
+                    if i_item < n_flex_sizes
+                    else _GRID_CELL_DEFAULT_STYLE
                 )
 
-                with html.Div(classes="d-flex", style=f"flex: {flex_size};"):
+                with html.Div(classes="d-flex", style=cell_style):
                     if isinstance(item, Layout):
                         LayoutGrid(item.items, item.direction, item.flex_sizes)
                     else:
                         with html.Div(
-                            classes="layout-grid-item",
-                            style="display: flex; flex: 1; border: 1px solid #222;",
+                            classes="layout-grid-item", style=_GRID_ITEM_STYLE
                         ):
                             client.ServerTemplate(name=item.singleton_tag)
 
     @classmethod
     def create_root_grid_ui(cls, layout: Layout):
-        with html.Div(
-            classes="d-flex flex-column flex-grow-1 fill-height",
-            style="background-color:black;",
-        ):
+        with html.Div(classes=_ROOT_GRID_CLASSES, style=_ROOT_GRID_STYLE):
             cls(layout.items, layout.direction, layout.flex_sizes)
 
 
-def pretty_xml(xml_str: str) -> str:
-    from lxml import etree
+_PRETTY_XML_PARSER = etree.XMLParser(remove_blank_text=True)
+
 
-    parser = etree.XMLParser(remove_blank_text=True)
-    root = etree.XML(xml_str, parser=parser)
+def pretty_xml(xml_str: str) -> str:
+    root = etree.XML(xml_str, parser=_PRETTY_XML_PARSER)
     return etree.tostring(root, pretty_print=True).decode()
 
 
-def vue_layout_to_slicer(layout: Layout):
-    layout_str = f'<layout type="{layout.direction.name.lower()}">'
+def vue_layout_to_slicer(layout: Layout) -> str:
+    xml_parts: list[str] = []
+    _append_slicer_layout_xml(layout, xml_parts)
+    return "".join(xml_parts)
+
+
+def _append_slicer_layout_xml(layout: Layout, xml_parts: list[str]) -> None:
+    xml_parts.append(f'<layout type="{layout.direction.name.lower()}">')
 
     item: Layout | ViewLayoutDefinition
     for item in layout.items:
-        item_xml = (
-            vue_layout_to_slicer(item) if isinstance(item, Layout) else item.to_xml()
-        )
-        layout_str += f"<item>{item_xml}</item>"
+        xml_parts.append("<item>")
+        if isinstance(item, Layout):
+            _append_slicer_layout_xml(item, xml_parts)
+        else:
+            xml_parts.append(item.to_xml())
+        xml_parts.append("</item>")
 
-    layout_str += "</layout>"
-    return layout_str
+    xml_parts.append("</layout>")
 
 
 def slicer_layout_to_vue(xml_str: str) -> Layout:
-    from lxml import etree
+    return _slicer_layout_element_to_vue(etree.fromstring(xml_str))
 
-    elt = etree.fromstring(xml_str)
 
+def _slicer_layout_element_to_vue(elt) -> Layout:
     def to_layout_item(child):
         _error_msg = "Invalid input XML layout"
-        if not child.tag == "item" or len(child.getchildren()) != 1:
+        sub_elements = list(child)
+        if not child.tag == "item" or len(sub_elements) != 1:
             raise RuntimeError(_error_msg)
 
-        child = child.getchildren()[0]
-        child_xml_str = etree.tostring(child)
+        child = sub_elements[0]
         if child.tag == "layout":
-            return slicer_layout_to_vue(child_xml_str)
+            return _slicer_layout_element_to_vue(child)
         if child.tag == "view":
-            return ViewLayoutDefinition.from_xml(child_xml_str)
+            return ViewLayoutDefinition.from_xml_element(child)
 
         raise RuntimeError(_error_msg)
 
-    items = [to_layout_item(child) for child in elt.getchildren()]
+    items = [to_layout_item(child) for child in elt]
 
     return Layout(direction=LayoutDirection[elt.attrib["type"].title()], items=items)
@@ -1,7 +1,9 @@
 import asyncio
+import time
+from enum import Enum, auto
 from typing import TYPE_CHECKING
 
-from trame_server.utils import asynchronous
+from trame_server.utils.asynchronous import get_event_loop
 
 if TYPE_CHECKING:
     from .abstract_view import AbstractView
@@ -11,10 +13,12 @@ class ScheduledRenderStrategy:
     """
     Abstract class for handling scheduled rendering.
     Rendering update is triggered by Slicer's display managers.
-    In asyncio context, the update can be managed using asyncio Tasks.
+    In asyncio context, the update can be managed using asyncio timers.
     In specific event loops, such as Qt, the rendering can be done using QTimer.
     """
 
+    __slots__ = ("abstract_view",)
+
     def __init__(self):
         self.abstract_view: AbstractView | None = None
 
@@ -24,40 +28,105 @@ class ScheduledRenderStrategy:
     def did_render(self):
         pass
 
+    def shutdown(self):
+        """
+        Called when the view is finalized. Cancels any pending render.
+        """
+
     def set_abstract_view(self, abstract_view: "AbstractView"):
         self.abstract_view = abstract_view
 
 
 class NoScheduleRendering(ScheduledRenderStrategy):
-    pass
+    __slots__ = ()
 
 
 class DirectRendering(ScheduledRenderStrategy):
+    __slots__ = ()
+
     def schedule_render(self):
         if self.abstract_view:
             self.abstract_view.render()
 
 
+class _RenderState(Enum):
+    IDLE = auto()
+    PENDING = auto()
+    RENDERING = auto()
+
+
 class AsyncIORendering(ScheduledRenderStrategy):
+    """
+    Renders the view using an asyncio timer at most once per frame period.
+    Render requests received while the view is rendering trigger a new render at the next frame deadline.
+    """
+
+    __slots__ = (
+        "_is_requested_while_rendering",
+        "_next_render_time",
+        "_render_handle",
+        "_state",
+        "schedule_render_fps",
+    )
+
     def __init__(self, schedule_render_fps: float = 30.0):
         super().__init__()
-        self.request_render_task: asyncio.Task | None = None
+        self._state = _RenderState.IDLE
+        self._render_handle: asyncio.TimerHandle | None = None
+        self._is_requested_while_rendering = False
+        self._next_render_time = 0.0
         self.schedule_render_fps = schedule_render_fps
 
     def schedule_render(self):
-        if self.request_render_task is None:
-            self.request_render_task = asynchronous.create_task(self._async_render())
-            self.request_render_task.add_done_callback(self.cleanup_render_task)
-
-    async def _async_render(self):
-        await asyncio.sleep(1.0 / self.schedule_render_fps)
-        if self.abstract_view:
-            self.abstract_view.render()
+        if self._state == _RenderState.RENDERING:
+            self._is_requested_while_rendering = True
+            return
+
+        if self._state == _RenderState.IDLE:
+            self._arm_render_timer()
+
+    def _arm_render_timer(self):
+        # Render at the next frame deadline rather than one full period after the request
+        # so that the time spent rendering doesn't lower the effective frame rate.
+        delay = max(0.0, self._next_render_time - time.monotonic())
+        self._render_handle = get_event_loop().call_later(
+            delay, self._on_render_timeout
+        )
+        self._state = _RenderState.PENDING
+
+    def _on_render_timeout(self):
+        self._render_handle = None
+        self._state = _RenderState.RENDERING
+        self._is_requested_while_rendering = False
+        frame_start_time = time.monotonic()
+        try:
+            if self.abstract_view:
+                self.abstract_view.render()
+        finally:
+            # Pace scheduled frames from their start time to keep the target frame rate
+            self._next_render_time = frame_start_time + self._frame_period()
+            self._state = _RenderState.IDLE
+
+        if self._is_requested_while_rendering:
+            self._is_requested_while_rendering = False
+            self._arm_render_timer()
+
+    def _frame_period(self) -> float:
+        return 1.0 / self.schedule_render_fps
 
     def did_render(self):
-        if self.request_render_task is not None:
-            self.request_render_task.cancel()
-            self.request_render_task = None
+        if self._state == _RenderState.RENDERING:
+            return
+
+        self._next_render_time = time.monotonic() + self._frame_period()
+        self._cancel_pending_render()
+
+    def shutdown(self):
+        self._cancel_pending_render()
+        self._is_requested_while_rendering = False
 
-    def cleanup_render_task(self, *_):
-        self.request_render_task = None
+    def _cancel_pending_render(self):
+        if self._render_handle is not None:
+            self._render_handle.cancel()
+            self._render_handle = None
+        self._state = _RenderState.IDLE
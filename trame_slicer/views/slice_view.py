@@ -21,6 +21,7 @@ from vtkmodules.vtkInteractionStyle import vtkInteractorStyleUser
 from vtkmodules.vtkRenderingCore import vtkActor2D, vtkImageMapper, vtkRenderer
 
 from .abstract_view import AbstractView
+from .render_scheduler import ScheduledRenderStrategy
 
 
 class SliceRendererManager(vtkMRMLLightBoxRendererManagerProxy):
@@ -53,7 +54,7 @@ class SliceRendererManager(vtkMRMLLightBoxRendererManagerProxy):
         return self.view.first_renderer()
 
     def SetImageDataConnection(self, imageDataConnection):
-        self.image_actor.GetMapper().SetInputConnection(imageDataConnection)
+        self.image_mapper.SetInputConnection(imageDataConnection)
         self.add_slice_actor_to_renderer_if_needed()
         self.image_actor.SetVisibility(bool(imageDataConnection))
 
@@ -71,22 +72,22 @@ class SliceView(AbstractView):
         scene: vtkMRMLScene,
         app_logic: vtkMRMLApplicationLogic,
         name: str,
-        *args,
-        **kwargs,
+        scheduled_render_strategy: ScheduledRenderStrategy | None = None,
     ):
-        super().__init__(*args, **kwargs)
+        super().__init__(scheduled_render_strategy)
 
         self.first_renderer().GetActiveCamera().ParallelProjectionOn()
 
         self.overlay_renderer = vtkRenderer()
         self.overlay_renderer.GetActiveCamera().ParallelProjectionOn()
         self.overlay_renderer.SetLayer(1)
-        self.render_window().SetNumberOfLayers(2)
-        self.render_window().AddRenderer(self.overlay_renderer)
-        self.render_window().SetAlphaBitPlanes(1)
+        render_window = self.render_window()
+        render_window.SetNumberOfLayers(2)
+        render_window.AddRenderer(self.overlay_renderer)
+        render_window.SetAlphaBitPlanes(1)
 
         # Observe interactor resize event as window resize event is triggered before the window is actually resized.
-        self.interactor().AddObserver(
+        self._resize_obs_id = self.interactor().AddObserver(
             vtkCommand.WindowResizeEvent, self._update_slice_size
         )
 
@@ -123,7 +124,7 @@ class SliceView(AbstractView):
         # Create slice logic
         self.logic = vtkMRMLSliceLogic()
         self.logic.SetMRMLApplicationLogic(app_logic)
-        self.logic.AddObserver(
+        self._logic_modified_obs_id = self.logic.AddObserver(
             vtkCommand.ModifiedEvent, self._on_slice_logic_modified_event
         )
         self._modified_dispatcher.attach_vtk_observer(self.logic, "ModifiedEvent")
@@ -133,6 +134,11 @@ class SliceView(AbstractView):
         self.set_mrml_scene(scene)
         self.interactor().SetInteractorStyle(vtkInteractorStyleUser())
 
+    def finalize(self):
+        self.interactor().RemoveObserver(self._resize_obs_id)
+        self.logic.RemoveObserver(self._logic_modified_obs_id)
+        super().finalize()
+
     def _reset_node_view_properties(self):
         super()._reset_node_view_properties()
         if not self.mrml_view_node:
@@ -158,14 +164,14 @@ class SliceView(AbstractView):
         self._set_image_data_connection(self.logic.GetImageDataConnection())
 
     def _set_image_data_connection(self, connection):
-        if self.image_data_connection == connection:
+        if self.image_data_connection is connection:
             return
 
         self.image_data_connection = connection
         self.render_manager.SetImageDataConnection(self.image_data_connection)
 
     def _update_slice_size(self, *_):
-        self.logic.ResizeSliceNode(*self.render_window().GetSize())
+        self.logic.ResizeSliceNode(*self._render_window.GetSize())
 
     def set_orientation(
         self,
@@ -200,6 +206,13 @@ class SliceView(AbstractView):
         _, resolution = self._get_slice_range_resolution()
         return resolution
 
+    def get_slice_range_and_step(self) -> tuple[float, float, float]:
+        """
+        Returns the slice range and step queried from the slice logic in a single call.
+        """
+        (range_min, range_max), resolution = self._get_slice_range_resolution()
+        return range_min, range_max, resolution
+
     def _get_slice_range_resolution(self) -> tuple[list[float], float]:
         slice_range = [-1.0, -1.0]
         resolution = reference(1.0)
@@ -25,6 +25,7 @@ from slicer import (
 from vtkmodules.vtkRenderingCore import vtkInteractorStyle3D
 
 from .abstract_view import AbstractView
+from .render_scheduler import ScheduledRenderStrategy
 from .threed_view_interaction_dispatch import ThreedViewInteractionDispatch
 
 
@@ -33,24 +34,32 @@ class RenderView(AbstractView):
     Copied and adapted from ctkVTKRenderView
     """
 
+    def __init__(
+        self,
+        scheduled_render_strategy: ScheduledRenderStrategy | None = None,
+    ):
+        super().__init__(scheduled_render_strategy)
+        self._visible_prop_bounds = [0.0] * 6
+
     def reset_focal_point(self):
-        bounds = [0] * 6
+        bounds = self._visible_prop_bounds
         self.renderer().ComputeVisiblePropBounds(bounds)
-        x_center = (bounds[1] + bounds[0]) / 2.0
-        y_center = (bounds[3] + bounds[2]) / 2.0
-        z_center = (bounds[5] + bounds[4]) / 2.0
-        self.set_focal_point(x_center, y_center, z_center)
+        x_min, x_max, y_min, y_max, z_min, z_max = bounds
+        self.set_focal_point(
+            (x_min + x_max) * 0.5, (y_min + y_max) * 0.5, (z_min + z_max) * 0.5
+        )
 
     def set_focal_point(self, x, y, z):
-        if not self.renderer().IsActiveCameraCreated():
+        renderer = self.renderer()
+        if not renderer.IsActiveCameraCreated():
             return
 
-        camera = self.renderer().GetActiveCamera()
+        camera = renderer.GetActiveCamera()
         camera.SetFocalPoint(x, y, z)
         camera.ComputeViewPlaneNormal()
         camera.OrthogonalizeViewUp()
-        self.renderer().ResetCameraClippingRange()
-        self.renderer().UpdateLightsGeometryToFollowCamera()
+        renderer.ResetCameraClippingRange()
+        renderer.UpdateLightsGeometryToFollowCamera()
 
 
 class ViewDirection(Enum):
@@ -72,10 +81,9 @@ class ThreeDView(RenderView):
         scene: vtkMRMLScene,
         app_logic: vtkMRMLApplicationLogic,
         name: str,
-        *args,
-        **kwargs,
+        scheduled_render_strategy: ScheduledRenderStrategy | None = None,
     ):
-        super().__init__(*args, **kwargs)
+        super().__init__(scheduled_render_strategy)
 
         factory = vtkMRMLThreeDViewDisplayableManagerFactory.GetInstance()
         factory.SetMRMLApplicationLogic(app_logic)
@@ -1,4 +1,3 @@
-from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -9,8 +8,16 @@ from trame_vuetify.widgets.vuetify3 import VBtn, VIcon, VSlider, VTooltip
 from .abstract_view import AbstractViewChild
 from .slice_view import SliceView
 
+_VIEW_GUTTER_STYLE = (
+    "position: absolute; top: 0; left: 0; background-color: transparent; height: 100%;"
+)
+_SLICE_SLIDER_GUTTER_STYLE = (
+    "position: absolute; bottom: 0; left: 0; background-color: transparent; "
+    "width: 100%;"
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SliderStateId:
     value_id: str
     min_id: str
@@ -23,39 +30,48 @@ def connect_slice_view_slider_to_state(
     view: SliceView,
     view_id: str,
 ) -> SliderStateId:
+    value_id = f"slider_value_{view_id}"
+    min_id = f"slider_min_{view_id}"
+    max_id = f"slider_max_{view_id}"
+    step_id = f"slider_step_{view_id}"
     slider_id = SliderStateId(
-        value_id=f"slider_value_{view_id}",
-        min_id=f"slider_min_{view_id}",
-        max_id=f"slider_max_{view_id}",
-        step_id=f"slider_step_{view_id}",
+        value_id=value_id, min_id=min_id, max_id=max_id, step_id=step_id
     )
 
-    _is_updating_from_trame = defaultdict(bool)
-    _is_updating_from_slicer = defaultdict(bool)
+    is_updating_from_trame = False
+    is_updating_from_slicer = False
 
-    @server.state.change(slider_id.value_id)
+    @server.state.change(value_id)
     def _on_view_slider_value_changed(*_, **kwargs):
-        if _is_updating_from_slicer[slider_id.value_id]:
+        nonlocal is_updating_from_trame
+        if is_updating_from_slicer:
             return
 
-        _is_updating_from_trame[slider_id.value_id] = True
-        view.set_slice_value(kwargs[slider_id.value_id])
-        _is_updating_from_trame[slider_id.value_id] = False
+        is_updating_from_trame = True
+        try:
+            view.set_slice_value(kwargs[value_id])
+        finally:
+            is_updating_from_trame = False
 
     def _on_slice_view_modified(_view: SliceView):
-        if _is_updating_from_trame[slider_id.value_id]:
+        nonlocal is_updating_from_slicer
+        if is_updating_from_trame:
             return
 
-        _is_updating_from_slicer[slider_id.value_id] = True
-        with server.state as state:
-            (
-                state[slider_id.min_id],
-                state[slider_id.max_id],
-            ) = _view.get_slice_range()
-            state[slider_id.step_id] = _view.get_slice_step()
-            state[slider_id.value_id] = _view.get_slice_value()
-            state.flush()
-        _is_updating_from_slicer[slider_id.value_id] = False
+        slice_min, slice_max, slice_step = _view.get_slice_range_and_step()
+        slider_state = {
+            min_id: slice_min,
+            max_id: slice_max,
+            step_id: slice_step,
+            value_id: _view.get_slice_value(),
+        }
+
+        is_updating_from_slicer = True
+        try:
+            with server.state as state:
+                state.update(slider_state)
+        finally:
+            is_updating_from_slicer = False
 
     view.add_modified_observer(_on_slice_view_modified)
     _on_slice_view_modified(view)
@@ -70,14 +86,7 @@ def create_vertical_view_gutter_ui(
     fill_gutter_f: Callable[[Server, str, AbstractViewChild], None] | None = None,
 ) -> None:
     with (
-        Div(
-            classes="view-gutter",
-            style="position: absolute;"
-            "top: 0;"
-            "left: 0;"
-            "background-color: transparent;"
-            "height: 100%;",
-        ),
+        Div(classes="view-gutter", style=_VIEW_GUTTER_STYLE),
         Div(classes="view-gutter-content d-flex flex-column fill-height pa-2"),
     ):
         with VBtn(
@@ -127,14 +136,7 @@ def create_vertical_slice_view_gutter_ui(
 ) -> None:
     create_vertical_view_gutter_ui(server, view_id, view, create_slice_buttons)
 
-    with Div(
-        classes="slice-slider-gutter",
-        style="position: absolute;"
-        "bottom: 0;"
-        "left: 0;"
-        "background-color: transparent;"
-        "width: 100%;",
-    ):
+    with Div(classes="slice-slider-gutter", style=_SLICE_SLIDER_GUTTER_STYLE):
         slider_id = connect_slice_view_slider_to_state(server, view, view_id)
 
         VSlider(
@@ -16,6 +16,7 @@ class IViewFactory(ABC):
 
     def __init__(self):
         self._views: dict[str, V] = {}
+        self._views_list_cache: list[AbstractViewChild] | None = None
 
     @abstractmethod
     def can_create_view(self, view: ViewLayoutDefinition) -> bool:
@@ -28,6 +29,7 @@ class IViewFactory(ABC):
         app_logic: vtkMRMLApplicationLogic,
     ) -> AbstractView:
         self._views[view.singleton_tag] = self._create_view(view, scene, app_logic)
+        self._views_list_cache = None
         return self.get_view(view.singleton_tag)
 
     def remove_view(self, view_id: str) -> bool:
@@ -35,6 +37,7 @@ class IViewFactory(ABC):
             return False
 
         del self._views[view_id]
+        self._views_list_cache = None
         return True
 
     @abstractmethod
@@ -58,11 +61,21 @@ class IViewFactory(ABC):
         return self._views[view_id]
 
     def get_views(self) -> list[AbstractViewChild]:
-        return [self._get_slicer_view(view) for view in self._views.values()]
+        """
+        Returns a copy of the views created by the factory in creation order.
+        """
+        if self._views_list_cache is None:
+            self._views_list_cache = [
+                self._get_slicer_view(view) for view in self._views.values()
+            ]
+        return list(self._views_list_cache)
 
     def has_view(self, view_id: str) -> bool:
         return view_id in self._views
 
+    def get_view_ids(self) -> set[str]:
+        return set(self._views)
+
     @abstractmethod
     def _get_slicer_view(self, view: V) -> AbstractViewChild:
         pass
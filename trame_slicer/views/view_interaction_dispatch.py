@@ -108,7 +108,7 @@ class ViewInteractionDispatch:
         processed = self._delegate_interaction_event_data_to_displayable_managers(
             event_data
         )
-        iren_state = self._view.interactor().GetInteractorStyle().GetState()
+        iren_state = self._view.interactor_style().GetState()
         if not processed or iren_state != vtkRenderingCore.VTKIS_NONE:
             self._process_events(event_id)
 
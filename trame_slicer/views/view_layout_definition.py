@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum, unique
 
+from lxml import etree
+
 from .abstract_view import ViewOrientation, ViewProps
 
 
@@ -10,7 +12,7 @@ class ViewType(Enum):
     THREE_D_VIEW = "vtkMRMLViewNode"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ViewLayoutDefinition:
     singleton_tag: str
     type: ViewType
@@ -21,11 +23,11 @@ class ViewLayoutDefinition:
 
     @classmethod
     def from_xml(cls, xml_str: str) -> "ViewLayoutDefinition":
-        from lxml import etree
-
-        elt = etree.fromstring(xml_str)
+        return cls.from_xml_element(etree.fromstring(xml_str))
 
-        properties = {child.get("name"): child.text for child in elt.getchildren()}
+    @classmethod
+    def from_xml_element(cls, elt) -> "ViewLayoutDefinition":
+        properties = {child.get("name"): child.text for child in elt}
         return cls(
             singleton_tag=elt.get("singletontag"),
             type=ViewType(elt.get("class")),